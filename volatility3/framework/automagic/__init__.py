@@ -54,30 +54,22 @@ def choose_automagic(
     in."""
 
     plugin_category = "None"
-    plugin_categories = plugin.__module__.split('.')
-    lowest_index = len(plugin_categories)
 
     automagic_categories = {'windows': windows_automagic, 'linux': linux_automagic, 'mac': mac_automagic}
 
-    for os in automagic_categories:
-        try:
-            if plugin_categories.index(os) < lowest_index:
-                lowest_index = plugin_categories.index(os)
-                plugin_category = os
-        except ValueError:
-            # The value wasn't found, try the next one
-            pass
+    # The earliest module component that names a category determines the plugin's category
+    for module_component in plugin.__module__.split('.'):
+        if module_component in automagic_categories:
+            plugin_category = module_component
+            break
 
     if plugin_category not in automagic_categories:
         vollog.info("No plugin category detected")
         return automagics
 
     vollog.info("Detected a {} category plugin".format(plugin_category))
-    output = []
-    for amagic in automagics:
-        if amagic.__class__.__name__ in automagic_categories[plugin_category]:
-            output += [amagic]
-    return output
+    category_automagics = frozenset(automagic_categories[plugin_category])
+    return [amagic for amagic in automagics if amagic.__class__.__name__ in category_automagics]
 
 
 def run(automagics: List[interfaces.automagic.AutomagicInterface],
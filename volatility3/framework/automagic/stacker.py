@@ -190,15 +190,13 @@ class LayerStacker(interfaces.automagic.AutomagicInterface):
 
     def create_stackers_list(self) -> List[Type[interfaces.automagic.StackerLayerInterface]]:
         """Creates the list of stackers to use based on the config option"""
-        stack_set = sorted(framework.class_subclasses(interfaces.automagic.StackerLayerInterface),
-                           key = lambda x: x.stack_order)
-        stacker_list = self.config.get('stackers', [])
-        if len(stacker_list):
-            result = []
-            for stacker in stack_set:
-                if stacker.__name__ in stacker_list:
-                    result.append(stacker)
-            stack_set = result
+        stacker_list = frozenset(self.config.get('stackers', []))
+        # Filter before sorting, so only the chosen stackers get sorted (and the sort is stable for equal orders)
+        stack_set = [
+            stacker for stacker in framework.class_subclasses(interfaces.automagic.StackerLayerInterface)
+            if not stacker_list or stacker.__name__ in stacker_list
+        ]
+        stack_set.sort(key = lambda x: x.stack_order)
         return stack_set
 
     @classmethod
@@ -252,10 +250,9 @@ def choose_os_stackers(plugin: Type[interfaces.plugins.PluginInterface]) -> List
     # Ensure all stackers are loaded
     framework.import_files(sys.modules['volatility3.framework.layers'])
 
-    result = []
-    for stacker in sorted(framework.class_subclasses(interfaces.automagic.StackerLayerInterface),
-                          key = lambda x: x.stack_order):
-        if plugin_first_level in stacker.exclusion_list:
-            continue
-        result.append(stacker.__name__)
-    return result
+    stackers = [
+        stacker for stacker in framework.class_subclasses(interfaces.automagic.StackerLayerInterface)
+        if plugin_first_level not in stacker.exclusion_list
+    ]
+    stackers.sort(key = lambda x: x.stack_order)
+    return [stacker.__name__ for stacker in stackers]
@@ -3,7 +3,7 @@
 #
 
 import logging
-from typing import Any, Iterable, List, Tuple, Type, Optional, Callable
+from typing import Any, Dict, Iterable, List, Tuple, Type, Optional, Callable
 
 from volatility3.framework import interfaces, constants, layers, exceptions
 from volatility3.framework.automagic import symbol_cache
@@ -55,20 +55,24 @@ class SymbolFinder(interfaces.automagic.AutomagicInterface):
             requirement, (requirements.TranslationLayerRequirement, requirements.SymbolTableRequirement),
             shortcut = False)
 
+        # Index the TranslationLayers by parent path, so siblings are found without rescanning every requirement
+        translation_layers = {}  # type: Dict[str, List[str]]
+        for (tl_sub_path, tl_requirement) in self._requirements:
+            if isinstance(tl_requirement, requirements.TranslationLayerRequirement):
+                tl_parent_path = interfaces.configuration.parent_path(tl_sub_path)
+                translation_layers.setdefault(tl_parent_path, []).append(tl_sub_path)
+
         for (sub_path, requirement) in self._requirements:
             parent_path = interfaces.configuration.parent_path(sub_path)
 
             if (isinstance(requirement, requirements.SymbolTableRequirement)
                     and requirement.unsatisfied(context, parent_path)):
-                for (tl_sub_path, tl_requirement) in self._requirements:
-                    tl_parent_path = interfaces.configuration.parent_path(tl_sub_path)
-                    # Find the TranslationLayer sibling to the SymbolTableRequirement
-                    if (isinstance(tl_requirement, requirements.TranslationLayerRequirement)
-                            and tl_parent_path == parent_path):
-                        if context.config.get(tl_sub_path, None):
-                            self._banner_scan(context, parent_path, requirement, context.config[tl_sub_path],
-                                              progress_callback)
-                            break
+                # Find the TranslationLayer sibling to the SymbolTableRequirement
+                for tl_sub_path in translation_layers.get(parent_path, []):
+                    if context.config.get(tl_sub_path, None):
+                        self._banner_scan(context, parent_path, requirement, context.config[tl_sub_path],
+                                          progress_callback)
+                        break
 
     def _banner_scan(self,
                      context: interfaces.context.ContextInterface,
@@ -257,10 +257,12 @@ class WintelHelper(interfaces.automagic.AutomagicInterface):
                 and requirement.requirements.get("class", False) and requirement.unsatisfied(context, config_path)):
             class_req = requirement.requirements["class"]
 
-            for test in self.tests:
-                if (test.layer_type.__module__ + "." + test.layer_type.__name__ == class_req.config_value(
-                        context, sub_config_path)):
-                    useful.append(test)
+            # Only the tests for the layer class named in the configuration are useful
+            layer_class_name = class_req.config_value(context, sub_config_path)
+            useful = [
+                test for test in self.tests
+                if test.layer_type.__module__ + "." + test.layer_type.__name__ == layer_class_name
+            ]
 
             # Determine if a class has been chosen
             # Once an appropriate class has been chosen, attempt to determine the page_map_offset value
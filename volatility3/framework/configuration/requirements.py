@@ -112,7 +112,7 @@ class ListRequirement(interfaces.configuration.RequirementInterface):
         if self.max_elements and not (len(value) < self.max_elements):
             vollog.log(constants.LOGLEVEL_V, "TypeError - Too many values provided to list option.")
             return {config_path: self}
-        if not all([isinstance(element, self.element_type) for element in value]):
+        if not all(isinstance(element, self.element_type) for element in value):
             vollog.log(constants.LOGLEVEL_V, "TypeError - At least one element in the list is not of the correct type.")
             return {config_path: self}
         return {}
@@ -128,7 +128,7 @@ class ChoiceRequirement(interfaces.configuration.RequirementInterface):
             choices: A list of possible string options that can be chosen from
         """
         super().__init__(*args, **kwargs)
-        if not isinstance(choices, list) or any([not isinstance(choice, str) for choice in choices]):
+        if not isinstance(choices, list) or any(not isinstance(choice, str) for choice in choices):
             raise TypeError("ChoiceRequirement takes a list of strings as choices")
         self.choices = choices
 
@@ -264,20 +264,21 @@ class TranslationLayerRequirement(interfaces.configuration.ConstructableRequirem
         value = self.config_value(context, config_path, None)
         if isinstance(value, str):
             if value not in context.layers:
-                vollog.log(constants.LOGLEVEL_V, "IndexError - Layer not found in memory space: {}".format(value))
-                return {config_path: self}
-            if self.oses and context.layers[value].metadata.get('os', None) not in self.oses:
-                vollog.log(constants.LOGLEVEL_V, "TypeError - Layer is not the required OS: {}".format(value))
-                return {config_path: self}
-            if (self.architectures
-                    and context.layers[value].metadata.get('architecture', None) not in self.architectures):
-                vollog.log(constants.LOGLEVEL_V, "TypeError - Layer is not the required Architecture: {}".format(value))
+                vollog.log(constants.LOGLEVEL_V, "IndexError - Layer not found in memory space: %s", value)
                 return {config_path: self}
+            if self.oses or self.architectures:
+                metadata = context.layers[value].metadata
+                if self.oses and metadata.get('os', None) not in self.oses:
+                    vollog.log(constants.LOGLEVEL_V, "TypeError - Layer is not the required OS: %s", value)
+                    return {config_path: self}
+                if self.architectures and metadata.get('architecture', None) not in self.architectures:
+                    vollog.log(constants.LOGLEVEL_V, "TypeError - Layer is not the required Architecture: %s", value)
+                    return {config_path: self}
             return {}
 
         if value is not None:
-            vollog.log(constants.LOGLEVEL_V,
-                       "TypeError - Translation Layer Requirement only accepts string labels: {}".format(repr(value)))
+            vollog.log(constants.LOGLEVEL_V, "TypeError - Translation Layer Requirement only accepts string labels: %r",
+                       value)
             return {config_path: self}
 
         # TODO: check that the space in the context lives up to the requirements for arch/os etc
@@ -285,7 +286,7 @@ class TranslationLayerRequirement(interfaces.configuration.ConstructableRequirem
         ### NOTE: This validate method has side effects (the dependencies can change)!!!
 
         self._validate_class(context, interfaces.configuration.parent_path(config_path))
-        vollog.log(constants.LOGLEVEL_V, "IndexError - No configuration provided: {}".format(config_path))
+        vollog.log(constants.LOGLEVEL_V, "IndexError - No configuration provided: %s", config_path)
         return {config_path: self}
 
     def construct(self, context: interfaces.context.ContextInterface, config_path: str) -> None:
@@ -302,6 +303,8 @@ class TranslationLayerRequirement(interfaces.configuration.ConstructableRequirem
 
         args = {"context": context, "config_path": config_path, "name": name}
 
+        # Deliberately a list rather than a generator: unsatisfied has side effects (constructable subrequirements
+        # expand their subtrees), so every subrequirement must be validated, not just those up to the first failure
         if any(
             [subreq.unsatisfied(context, config_path) for subreq in self.requirements.values() if not subreq.optional]):
             return None
@@ -332,20 +335,18 @@ class SymbolTableRequirement(interfaces.configuration.ConstructableRequirementIn
         config_path = interfaces.configuration.path_join(config_path, self.name)
         value = self.config_value(context, config_path, None)
         if not isinstance(value, str) and value is not None:
-            vollog.log(constants.LOGLEVEL_V,
-                       "TypeError - SymbolTableRequirement only accepts string labels: {}".format(repr(value)))
+            vollog.log(constants.LOGLEVEL_V, "TypeError - SymbolTableRequirement only accepts string labels: %r", value)
             return {config_path: self}
         if value and value in context.symbol_space:
             # This is an expected situation, so return rather than raise
             return {}
         elif value:
-            vollog.log(constants.LOGLEVEL_V, "IndexError - Value not present in the symbol space: {}".format(value
-                                                                                                             or ""))
+            vollog.log(constants.LOGLEVEL_V, "IndexError - Value not present in the symbol space: %s", value)
 
         ### NOTE: This validate method has side effects (the dependencies can change)!!!
 
         self._validate_class(context, interfaces.configuration.parent_path(config_path))
-        vollog.log(constants.LOGLEVEL_V, "Symbol table requirement not yet fulfilled: {}".format(config_path))
+        vollog.log(constants.LOGLEVEL_V, "Symbol table requirement not yet fulfilled: %s", config_path)
         return {config_path: self}
 
     def construct(self, context: interfaces.context.ContextInterface, config_path: str) -> None:
@@ -357,6 +358,8 @@ class SymbolTableRequirement(interfaces.configuration.ConstructableRequirementIn
 
         args = {"context": context, "config_path": config_path, "name": name}
 
+        # Deliberately a list rather than a generator: unsatisfied has side effects (constructable subrequirements
+        # expand their subtrees), so every subrequirement must be validated, not just those up to the first failure
         if any(
             [subreq.unsatisfied(context, config_path) for subreq in self.requirements.values() if not subreq.optional]):
             return None
@@ -81,17 +81,19 @@ class AutomagicInterface(interfaces.configuration.ConfigurableInterface, metacla
         Returns:
             A list of tuples containing the config_path, sub_config_path and requirement identifying the unsatisfied `Requirements`
         """
-        sub_config_path = interfaces.configuration.path_join(config_path, requirement_root.name)
         results = []  # type: List[Tuple[str, interfaces.configuration.RequirementInterface]]
-        recurse = not shortcut
-        if isinstance(requirement_root, requirement_type):
-            if recurse or requirement_root.unsatisfied(context, config_path):
-                results.append((sub_config_path, requirement_root))
-        else:
-            recurse = True
-        if recurse:
-            for subreq in requirement_root.requirements.values():
-                results += self.find_requirements(context, sub_config_path, subreq, requirement_type, shortcut)
+        # Walk the tree depth first using an explicit stack of (parent config path, requirement) pairs,
+        # children are pushed in reverse so that they're visited in their original order
+        stack = [(config_path, requirement_root)]
+        while stack:
+            parent_config_path, requirement = stack.pop()
+            sub_config_path = interfaces.configuration.path_join(parent_config_path, requirement.name)
+            if isinstance(requirement, requirement_type):
+                if not shortcut or requirement.unsatisfied(context, parent_config_path):
+                    results.append((sub_config_path, requirement))
+                if shortcut:
+                    continue
+            stack += [(sub_config_path, subreq) for subreq in reversed(list(requirement.requirements.values()))]
         return results
 
 
@@ -105,21 +105,6 @@ class HierarchicalDict(collections.abc.Mapping):
         Hierarchy."""
         return self._data.copy()
 
-    def _key_head(self, key: str) -> str:
-        """Returns the first division of a key based on the dict separator, or
-        the full key if the separator is not present."""
-        if self.separator in key:
-            return key[:key.index(self.separator)]
-        else:
-            return key
-
-    def _key_tail(self, key: str) -> str:
-        """Returns all but the first division of a key based on the dict
-        separator, or None if the separator is not in the key."""
-        if self.separator in key:
-            return key[key.index(self.separator) + 1:]
-        return ''
-
     def __iter__(self) -> Iterator[Any]:
         """Returns an iterator object that supports the iterator protocol."""
         return self.generator()
@@ -131,21 +116,24 @@ class HierarchicalDict(collections.abc.Mapping):
         Returns:
             Returns each item in the top level data, and then all subkeys in a depth first order
         """
+        separator = self._separator
         for key in self._data:
             yield key
         for subdict_key in self._subdict:
             for key in self._subdict[subdict_key]:
-                yield subdict_key + self.separator + key
+                yield subdict_key + separator + key
 
     def __getitem__(self, key: str) -> ConfigSimpleType:
         """Gets an item, traversing down the trees to get to the final
         value."""
+        current = self
         try:
-            if self.separator in key:
-                subdict = self._subdict[self._key_head(key)]
-                return subdict[self._key_tail(key)]
-            else:
-                return self._data[key]
+            # Descend through the levels iteratively, rather than recursing into each subdict
+            head, separator, tail = key.partition(current._separator)
+            while separator:
+                current = current._subdict[head]
+                head, separator, tail = tail.partition(current._separator)
+            return current._data[head]
         except KeyError:
             raise KeyError(key)
 
@@ -155,10 +143,14 @@ class HierarchicalDict(collections.abc.Mapping):
 
     def _setitem(self, key: str, value: Any, is_data: bool = True) -> None:
         """Set an item or appends a whole subtree at a key location."""
-        if self.separator in key:
-            subdict = self._subdict.get(self._key_head(key), HierarchicalDict(separator = self.separator))
-            subdict._setitem(self._key_tail(key), value, is_data)
-            self._subdict[self._key_head(key)] = subdict
+        head, separator, tail = key.partition(self._separator)
+        if separator:
+            subdict = self._subdict.get(head, None)
+            if subdict is None:
+                # Only construct (and validate) a new level when one doesn't already exist
+                subdict = HierarchicalDict(separator = separator)
+            subdict._setitem(tail, value, is_data)
+            self._subdict[head] = subdict
         else:
             if is_data:
                 self._data[key] = self._sanitize_value(value)
@@ -196,25 +188,27 @@ class HierarchicalDict(collections.abc.Mapping):
 
     def __delitem__(self, key: str) -> None:
         """Deletes an item from the hierarchical dict."""
+        current = self
         try:
-            if self.separator in key:
-                subdict = self._subdict[self._key_head(key)]
-                del subdict[self._key_tail(key)]
-            else:
-                del self._data[self._key_head(key)]
+            head, separator, tail = key.partition(current._separator)
+            while separator:
+                current = current._subdict[head]
+                head, separator, tail = tail.partition(current._separator)
+            del current._data[head]
         except KeyError:
             raise KeyError(key)
 
     def __contains__(self, key: Any) -> bool:
         """Determines whether the key is present in the hierarchy."""
-        if self.separator in key:
-            try:
-                subdict = self._subdict[self._key_head(key)]
-                return self._key_tail(key) in subdict
-            except KeyError:
+        current = self
+        head, separator, tail = key.partition(current._separator)
+        while separator:
+            subdict = current._subdict.get(head, None)
+            if subdict is None:
                 return False
-        else:
-            return key in self._data
+            current = subdict
+            head, separator, tail = tail.partition(current._separator)
+        return head in current._data
 
     def __len__(self) -> int:
         """Returns the length of all items."""
@@ -235,13 +229,16 @@ class HierarchicalDict(collections.abc.Mapping):
         Returns:
             The HierarchicalDict underneath the specified key (not just the data at that key location in the tree)
         """
-        try:
-            if self.separator in key:
-                return self._subdict[self._key_head(key)].branch(self._key_tail(key))
-            else:
-                return self._subdict[key]
-        except KeyError:
-            self._setitem(key = key, value = HierarchicalDict(separator = self.separator), is_data = False)
+        current, current_key = self, key
+        while True:
+            head, separator, tail = current_key.partition(current._separator)
+            subdict = current._subdict.get(head, None)
+            if subdict is None:
+                break
+            if not separator:
+                return subdict
+            current, current_key = subdict, tail
+        current._setitem(key = current_key, value = HierarchicalDict(separator = current.separator), is_data = False)
         return HierarchicalDict()
 
     def splice(self, key: str, value: 'HierarchicalDict') -> None:
@@ -458,10 +455,8 @@ class SimpleTypeRequirement(RequirementInterface):
 
         value = self.config_value(context, config_path, None)
         if not isinstance(value, self.instance_type):
-            vollog.log(
-                constants.LOGLEVEL_V,
-                "TypeError - {} requirements only accept {} type: {}".format(self.name, self.instance_type.__name__,
-                                                                             repr(value)))
+            vollog.log(constants.LOGLEVEL_V, "TypeError - %s requirements only accept %s type: %r", self.name,
+                       self.instance_type.__name__, value)
             return {config_path: self}
         return {}
 
@@ -530,6 +525,7 @@ class ConstructableRequirementInterface(RequirementInterface):
         super().__init__(*args, **kwargs)
         self.add_requirement(ClassRequirement("class", "Class of the constructable requirement"))
         self._current_class_requirements = set()  # type: Set[Any]
+        self._current_class = None  # type: Optional[Type]
 
     def __eq__(self, other):
         # We can just use super because it checks all member of `__dict__`
@@ -560,6 +556,11 @@ class ConstructableRequirementInterface(RequirementInterface):
         if not class_req.unsatisfied(context, subreq_config_path) and isinstance(class_req, ClassRequirement):
             # We have a class, and since it's validated we can construct our requirements from it
             if issubclass(class_req.cls, ConfigurableInterface):
+                # The requirements for this class have already been populated, so don't rebuild the subtree
+                # (doing so would discard any subrequirements that have since been populated themselves)
+                if class_req.cls is self._current_class:
+                    return
+                self._current_class = class_req.cls
                 # In case the class has changed, clear out the old requirements
                 for old_req in self._current_class_requirements.copy():
                     del self._requirements[old_req]
@@ -16,7 +16,7 @@ import threading
 import traceback
 import types
 from abc import ABCMeta, abstractmethod
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 
 from volatility3.framework import constants, exceptions, interfaces
 
@@ -354,9 +354,28 @@ class DataLayerInterface(interfaces.configuration.ConfigurableInterface, metacla
 
     @property
     def metadata(self) -> Mapping:
-        """Returns a ReadOnly copy of the metadata published by this layer."""
-        maps = [self.context.layers[layer_name].metadata for layer_name in self.dependencies]
-        return interfaces.objects.ReadOnlyMapping(collections.ChainMap(self._metadata, self._direct_metadata, *maps))
+        """Returns a ReadOnly copy of the metadata published by this layer.
+
+        The metadata of each lower layer is chained in depth first order,
+        with each layer included only once (even if several layers depend
+        upon it) since later occurrences would never be consulted.  Lower
+        layers that override this property have their own metadata chained
+        instead.
+        """
+        maps = []  # type: List[Mapping]
+        visited = set()  # type: Set[str]
+        stack = [self]  # type: List[DataLayerInterface]
+        while stack:
+            layer = stack.pop()
+            if layer.name in visited:
+                continue
+            visited.add(layer.name)
+            if layer is not self and type(layer).metadata is not DataLayerInterface.metadata:
+                maps.append(layer.metadata)
+                continue
+            maps += [layer._metadata, layer._direct_metadata]
+            stack += [self.context.layers[layer_name] for layer_name in reversed(layer.dependencies)]
+        return interfaces.objects.ReadOnlyMapping(collections.ChainMap(*maps))
 
 
 class TranslationLayerInterface(DataLayerInterface, metaclass = ABCMeta):
@@ -620,9 +639,36 @@ class LayerContainer(collections.abc.Mapping):
 
     def check_cycles(self) -> None:
         """Runs through the available layers and identifies if there are cycles
-        in the DAG."""
-        # TODO: Is having a cycle check necessary?
-        raise NotImplementedError("Cycle checking has not yet been implemented")
+        in the DAG.
+
+        This carries out a depth first search, tracking the layers whose dependencies are still being explored
+        (any dependency on one of those indicates a cycle) and those that have been completely explored (which
+        need not be explored again).
+
+        Raises:
+            LayerException: If a layer depends (directly or indirectly) upon itself
+        """
+        in_progress = set()  # type: Set[str]
+        completed = set()  # type: Set[str]
+        for layer_name in self._layers:
+            if layer_name in completed:
+                continue
+            in_progress.add(layer_name)
+            stack = [(layer_name, iter(self._layers[layer_name].dependencies))]
+            while stack:
+                current_name, dependencies = stack[-1]
+                for dependency in dependencies:
+                    if dependency in in_progress:
+                        raise exceptions.LayerException(dependency,
+                                                        "Layer {} is part of a dependency cycle".format(dependency))
+                    if dependency not in completed and dependency in self._layers:
+                        in_progress.add(dependency)
+                        stack.append((dependency, iter(self._layers[dependency].dependencies)))
+                        break
+                else:
+                    stack.pop()
+                    in_progress.remove(current_name)
+                    completed.add(current_name)
 
 
 class DummyProgress(object):
@@ -47,6 +47,7 @@ class ColumnSortKey(metaclass = ABCMeta):
 
 
 class TreeNode(abc.Sequence, metaclass = ABCMeta):
+    __slots__ = ()
 
     def __init__(self, path, treegrid, parent, values):
         """Initializes the TreeNode."""
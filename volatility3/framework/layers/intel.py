@@ -179,10 +179,8 @@ class Intel(linear.LinearlyMappedLayer):
         address."""
         try:
             # TODO: Consider reimplementing this, since calls to mapping can call is_valid
-            return all([
-                self._context.layers[layer].is_valid(mapped_offset)
-                for _, _, mapped_offset, _, layer in self.mapping(offset, length)
-            ])
+            return all(self._context.layers[layer].is_valid(mapped_offset)
+                       for _, _, mapped_offset, _, layer in self.mapping(offset, length))
         except exceptions.InvalidAddressException:
             return False
 
@@ -247,10 +247,8 @@ class RegistryHive(linear.LinearlyMappedLayer):
         """Returns a boolean based on whether the offset is valid or not."""
         try:
             # Pass this to the lower layers for now
-            return all([
-                self.context.layers[layer].is_valid(offset, length)
-                for (_, _, offset, length, layer) in self.mapping(offset, length)
-            ])
+            return all(self.context.layers[layer].is_valid(offset, length)
+                       for (_, _, offset, length, layer) in self.mapping(offset, length))
         except exceptions.InvalidAddressException:
             return False
 
@@ -47,6 +47,8 @@ class NotAvailableValue(interfaces.renderers.BaseAbsentValue):
 
 class TreeNode(interfaces.renderers.TreeNode):
     """Class representing a particular node in a tree grid."""
+    # Nodes are created for every row of output, so avoid a per-instance __dict__
+    __slots__ = ('_treegrid', '_parent', '_path', '_values')
 
     def __init__(self, path: str, treegrid: 'TreeGrid', parent: Optional[interfaces.renderers.TreeNode],
                  values: List[interfaces.renderers.BaseTypes]) -> None:
@@ -2,7 +2,6 @@
 # which is available at https://www.volatilityfoundation.org/license/vsl-v1.0
 #
 
-import collections
 import collections.abc
 import enum
 import logging
@@ -31,7 +30,7 @@ class SymbolSpace(interfaces.symbols.SymbolSpaceInterface):
 
     def __init__(self) -> None:
         super().__init__()
-        self._dict = collections.OrderedDict()  # type: Dict[str, interfaces.symbols.BaseSymbolTableInterface]
+        self._dict = {}  # type: Dict[str, interfaces.symbols.BaseSymbolTableInterface]
         # Permanently cache all resolved symbols
         self._resolved = {}  # type: Dict[str, interfaces.objects.Template]
         self._resolved_symbols = {}  # type: Dict[str, interfaces.objects.Template]